@@ -1,6 +1,6 @@
 from __future__ import annotations
 from collections import deque
-from collections.abc import Callable, Iterator
+from collections.abc import Callable
 from dataclasses import dataclass
 from operator import attrgetter
 import os
@@ -25,47 +25,23 @@ if TYPE_CHECKING:
 
     SupportsRichComparison = Union[SupportsLT[Any], SupportsGT[Any]]
 
-    class ScandirIterator(Protocol[AnyStr], Iterator[os.DirEntry[AnyStr]]):
-        def close(self) -> None: ...
+    # A DirEntry together with the result of calling is_dir() on it, computed
+    # exactly once per entry:
+    EntryPair = tuple[os.DirEntry[AnyStr], bool]
 
-    class DirEntryIter(Protocol[AnyStr], Iterator[os.DirEntry[AnyStr]]):
-        dirpath: Path
+#: The default ``sort_key``, shared across all `iterpath()` calls
+NAME_KEY = attrgetter("name")
 
-        def close(self) -> None: ...
 
+class DirEntries(Generic[AnyStr]):
+    __slots__ = ("dirpath", "entries")
 
-@dataclass
-class FilteredDirEntries(Generic[AnyStr]):
     dirpath: Path
-    scaniter: ScandirIterator[AnyStr]
-    iterpath: Iterpath[AnyStr]
+    entries: deque[EntryPair[AnyStr]]
 
-    def __iter__(self) -> FilteredDirEntries:
-        return self
-
-    def __next__(self) -> os.DirEntry[AnyStr]:
-        while True:
-            e = next(self.scaniter)
-            if self.iterpath.filter_entry(e):
-                return e
-
-    def close(self) -> None:
-        self.scaniter.close()
-
-
-@dataclass
-class SortedDirEntries(Generic[AnyStr]):
-    dirpath: Path
-    entries: deque[os.DirEntry[AnyStr]]
-
-    def __iter__(self) -> SortedDirEntries:
-        return self
-
-    def __next__(self) -> os.DirEntry[AnyStr]:
-        try:
-            return self.entries.popleft()
-        except IndexError:
-            raise StopIteration
+    def __init__(self, dirpath: Path, entries: deque[EntryPair[AnyStr]]) -> None:
+        self.dirpath = dirpath
+        self.entries = entries
 
     def close(self) -> None:
         self.entries.clear()
@@ -77,7 +53,8 @@ class Iterpath(Generic[AnyStr]):
     The return type of `iterpath()`.  This is both an iterator and a context
     manager.  As an iterator, it traverses a directory tree and yields
     `pathlib.Path` objects.  As a context manager, it returns itself on entry
-    and, on exit, closes any remaining internal `os.scandir()` iterators.
+    and, on exit, discards any directory entries buffered for the remainder of
+    the traversal.
 
     As an alternative to using an `Iterpath` as a context manager, the
     `close()` method can be called explicitly to clean up when finished.
@@ -88,10 +65,9 @@ class Iterpath(Generic[AnyStr]):
 
     dirpath: AnyStr | os.PathLike[AnyStr]
     pdirpath: Path
-    filter_dirs: Callable[[os.DirEntry[AnyStr]], Any]
-    filter_files: Callable[[os.DirEntry[AnyStr]], Any]
-    exclude_dirs: Callable[[os.DirEntry[AnyStr]], Any]
-    exclude_files: Callable[[os.DirEntry[AnyStr]], Any]
+    accept_dirs: Optional[Callable[[os.DirEntry[AnyStr]], bool]]
+    accept_files: Optional[Callable[[os.DirEntry[AnyStr]], bool]]
+    filtering: bool
     topdown: bool
     include_root: bool
     dirs: bool
@@ -101,7 +77,8 @@ class Iterpath(Generic[AnyStr]):
     onerror: Optional[Callable[[OSError], Any]]
     followlinks: bool
     return_relative: bool
-    dirstack: Optional[list[DirEntryIter[AnyStr]]] = None
+    relprefix: str
+    dirstack: Optional[list[DirEntries[AnyStr]]] = None
     pending: Optional[os.DirEntry[AnyStr]] = None
 
     def __enter__(self) -> Iterpath:
@@ -126,34 +103,32 @@ class Iterpath(Generic[AnyStr]):
         if self.pending is not None:
             self.dirstack.append(self.get_entries(self.pending))
             self.pending = None
-        while self.dirstack:
-            try:
-                e = next(self.dirstack[-1])
-            except (OSError, StopIteration) as exc:
-                if isinstance(exc, OSError) and self.onerror is not None:
-                    self.onerror(exc)
-                d = self.dirstack.pop()
-                if (
-                    self.dirs
-                    and not self.topdown
-                    and (self.dirstack or self.include_root)
-                ):
+        # Keep the hot loop's lookups in local variables:
+        dirstack = self.dirstack
+        dirs = self.dirs
+        topdown = self.topdown
+        while dirstack:
+            entries = dirstack[-1].entries
+            if not entries:
+                d = dirstack.pop()
+                if dirs and not topdown and (dirstack or self.include_root):
                     return self.relativize(d.dirpath)
                 continue
-            if e.is_dir(follow_symlinks=self.followlinks):
-                if self.dirs and self.topdown:
+            e, is_dir = entries.popleft()
+            if is_dir:
+                if dirs and topdown:
                     self.pending = e
-                    return self.relativize(Path(os.fsdecode(e)))
+                    return self.relativize(self.entry_path(e))
                 else:
-                    self.dirstack.append(self.get_entries(e))
+                    dirstack.append(self.get_entries(e))
             else:
-                return self.relativize(Path(os.fsdecode(e)))
+                return self.relativize(self.entry_path(e))
         raise StopIteration
 
     def close(self) -> None:
         """
-        Close any remaining internal `os.scandir()` iterators and clear the
-        directory stack.  After calling this method, no further iteration over
+        Discard any buffered directory entries and clear the directory stack.
+        After calling this method, no further iteration over
         the `Iterpath` will be possible.
 
         This method has the same effect as ``__exit__``.
@@ -161,47 +136,73 @@ class Iterpath(Generic[AnyStr]):
         while self.dirstack:
             self.dirstack.pop().close()
 
-    def filter_entry(self, e: os.DirEntry[AnyStr]) -> bool:
-        if e.is_dir(follow_symlinks=self.followlinks):
-            return bool(self.filter_dirs(e)) and not self.exclude_dirs(e)
+    def entry_path(self, e: os.DirEntry[AnyStr]) -> Path:
+        # DirEntry.path is already joined with the parent directory's path, so
+        # the yielded Path can be built directly from it, skipping
+        # os.fsdecode() entirely when traversing in str mode:
+        p = e.path
+        if isinstance(p, bytes):
+            return Path(os.fsdecode(p))
         else:
-            return bool(self.filter_files(e)) and not self.exclude_files(e)
-
-    def get_entries(self, p: AnyStr | os.PathLike[AnyStr]) -> DirEntryIter[AnyStr]:
-        pp = Path(os.fsdecode(p))
+            return Path(p)
+
+    def filter_entry(self, e: os.DirEntry[AnyStr], is_dir: bool) -> bool:
+        accept = self.accept_dirs if is_dir else self.accept_files
+        return accept is None or accept(e)
+
+    def get_entries(self, p: AnyStr | os.PathLike[AnyStr]) -> DirEntries[AnyStr]:
+        # Unwrap any path-like object just once; the raw result serves both
+        # os.scandir() (PyPy on Windows, as of v7.3.3, requires a string) and
+        # the construction of the directory's Path:
+        sp = os.fspath(p)
+        if isinstance(sp, bytes):
+            pp = Path(os.fsdecode(sp))
+        else:
+            pp = Path(sp)
         try:
-            # Use fspath() here because PyPy on Windows (as of v7.3.3) requires
-            # a string:
-            scaniter = os.scandir(os.fspath(p))
+            scaniter = os.scandir(sp)
         except OSError as exc:
             if self.onerror is not None:
                 self.onerror(exc)
-            return SortedDirEntries(pp, deque())
-        filtered = FilteredDirEntries(pp, scaniter, self)
+            return DirEntries(pp, deque())
+        entry_list: list[EntryPair[AnyStr]] = []
+        followlinks = self.followlinks
+        filtering = self.filtering
+        filter_entry = self.filter_entry
+        append = entry_list.append
+        with scaniter:
+            try:
+                for e in scaniter:
+                    is_dir = e.is_dir(follow_symlinks=followlinks)
+                    if not filtering or filter_entry(e, is_dir):
+                        append((e, is_dir))
+            except OSError as exc:
+                if self.onerror is not None:
+                    self.onerror(exc)
         if self.sort:
-            entry_list = []
-            while True:
-                try:
-                    e = next(filtered)
-                except StopIteration:
-                    break
-                except OSError as exc:
-                    if self.onerror is not None:
-                        self.onerror(exc)
-                    break
-                else:
-                    entry_list.append(e)
-            filtered.close()
-            entry_list.sort(key=self.sort_key, reverse=self.sort_reverse)
-            return SortedDirEntries(pp, deque(entry_list))
-        else:
-            return filtered
+            entry_list.sort(
+                key=lambda ed: self.sort_key(ed[0]), reverse=self.sort_reverse
+            )
+        return DirEntries(pp, deque(entry_list))
 
     def relativize(self, p: Path) -> Path:
-        if self.return_relative:
-            return p.relative_to(self.pdirpath)
-        else:
+        if not self.return_relative:
             return p
+        prefix = self.relprefix
+        if not prefix:
+            # dirpath was the current directory, so the yielded paths are
+            # already relative:
+            return p
+        # Every yielded path was built by extending pdirpath, so stripping the
+        # prefix off the string form is equivalent to (but much cheaper than)
+        # Path.relative_to():
+        s = str(p)
+        if s.startswith(prefix):
+            return Path(s[len(prefix):])
+        elif p == self.pdirpath:
+            return Path()
+        else:
+            return p.relative_to(self.pdirpath)
 
 
 def iterpath(
@@ -229,9 +230,9 @@ def iterpath(
     directories within as `pathlib.Path` instances.
 
     The return value is both an iterator and a context manager.  In order to
-    ensure that the internal `os.scandir()` iterators are closed properly,
-    either call the ``close()`` method when done or else use it as a context
-    manager like so::
+    discard any directory entries buffered for the remainder of the traversal
+    when finished, either call the ``close()`` method when done or else use it
+    as a context manager like so::
 
         with iterpath(...) as ip:
             for path in ip:
@@ -338,44 +339,43 @@ def iterpath(
     else:
         pdirpath = Path(os.fsdecode(dirpath))
 
+    if return_relative and pdirpath != Path():
+        relprefix = str(pdirpath) + os.sep
+    else:
+        relprefix = ""
+
     if sort_key is None:
-        sort_key = attrgetter("name")
+        sort_key = NAME_KEY
 
     if filter is not None and filter_dirs is not None:
         raise TypeError("filter and filter_dirs are mutually exclusive")
     elif filter is not None:
         filter_dirs = filter
-    elif filter_dirs is None:
-        filter_dirs = to_true
 
     if filter is not None and filter_files is not None:
         raise TypeError("filter and filter_files are mutually exclusive")
     elif filter is not None:
         filter_files = filter
-    elif filter_files is None:
-        filter_files = to_true
 
     if exclude is not None and exclude_dirs is not None:
         raise TypeError("exclude and exclude_dirs are mutually exclusive")
     elif exclude is not None:
         exclude_dirs = exclude
-    elif exclude_dirs is None:
-        exclude_dirs = to_false
 
     if exclude is not None and exclude_files is not None:
         raise TypeError("exclude and exclude_files are mutually exclusive")
     elif exclude is not None:
         exclude_files = exclude
-    elif exclude_files is None:
-        exclude_files = to_false
+
+    accept_dirs = compose_filters(filter_dirs, exclude_dirs)
+    accept_files = compose_filters(filter_files, exclude_files)
 
     return Iterpath(
         dirpath=dirpath,
         pdirpath=pdirpath,
-        filter_dirs=filter_dirs,
-        filter_files=filter_files,
-        exclude_dirs=exclude_dirs,
-        exclude_files=exclude_files,
+        accept_dirs=accept_dirs,
+        accept_files=accept_files,
+        filtering=accept_dirs is not None or accept_files is not None,
         topdown=topdown,
         include_root=include_root,
         dirs=dirs,
@@ -385,12 +385,29 @@ def iterpath(
         onerror=onerror,
         followlinks=followlinks,
         return_relative=return_relative,
+        relprefix=relprefix,
     )
 
 
-def to_true(_: Any) -> bool:
-    return True
-
-
-def to_false(_: Any) -> bool:
-    return False
+def compose_filters(
+    filter: Optional[Callable[[os.DirEntry[AnyStr]], Any]],  # noqa: A002
+    exclude: Optional[Callable[[os.DirEntry[AnyStr]], Any]],
+) -> Optional[Callable[[os.DirEntry[AnyStr]], bool]]:
+    """
+    Combine a ``filter`` and an ``exclude`` predicate into a single "accept"
+    predicate that makes the minimum number of calls, or `None` if neither
+    predicate was supplied
+    """
+    if filter is None:
+        if exclude is None:
+            return None
+        else:
+            exc = exclude
+            return lambda e: not exc(e)
+    elif exclude is None:
+        flt = filter
+        return lambda e: bool(flt(e))
+    else:
+        flt = filter
+        exc = exclude
+        return lambda e: bool(flt(e)) and not exc(e)
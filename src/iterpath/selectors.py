@@ -1,10 +1,12 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from dataclasses import dataclass
-from fnmatch import fnmatch
+import fnmatch
 import os
 import re
-from typing import Any, AnyStr, Generic
+from typing import Any, AnyStr, Callable, Generic, Optional, cast
+import warnings
 
 
 class Selector(ABC, Generic[AnyStr]):
@@ -14,6 +16,8 @@ class Selector(ABC, Generic[AnyStr]):
     Base class for selectors
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def __call__(self, entry: os.DirEntry[AnyStr]) -> bool: ...
 
@@ -37,10 +41,28 @@ class SelectAny(Selector[AnyStr]):
     This class is the return type of ``|`` on two selectors.
     """
 
-    selectors: list[Selector[AnyStr]]
+    __slots__ = ("selectors", "_fused")
+
+    selectors: Sequence[Selector[AnyStr]]
+
+    def __post_init__(self) -> None:
+        # Freeze the selectors into a tuple so that __call__ can loop over
+        # them without re-reading a mutable list:
+        self.selectors = tuple(self.selectors)
+        self._fused: Optional[Callable[[str], Any]] = fuse_selectors(
+            self.selectors
+        )
 
     def __call__(self, entry: os.DirEntry[AnyStr]) -> bool:
-        return any(s(entry) for s in self.selectors)
+        name = entry.name
+        fused = self._fused
+        # Fusion only ever succeeds for chains of str-based selectors:
+        if fused is not None and isinstance(name, str):
+            return fused(name) is not None
+        for s in self.selectors:
+            if s(entry):
+                return True
+        return False
 
 
 class SelectNames(Selector[AnyStr]):
@@ -51,17 +73,21 @@ class SelectNames(Selector[AnyStr]):
     ``case_sensitive`` is `False`, the check is performed case-insensitively.
     """
 
+    __slots__ = ("names", "case_sensitive", "_hash")
+
     def __init__(self, *names: AnyStr, case_sensitive: bool = True) -> None:
-        self.names: set[AnyStr] = set(names)
         self.case_sensitive: bool = case_sensitive
-        if not case_sensitive:
-            self.names = {n.lower() for n in self.names}
+        if case_sensitive:
+            self.names: frozenset[AnyStr] = frozenset(names)
+        else:
+            self.names = frozenset(n.lower() for n in names)
+        self._hash: int = hash((self.names, self.case_sensitive))
 
     def __call__(self, entry: os.DirEntry[AnyStr]) -> bool:
-        name = entry.name
-        if not self.case_sensitive:
-            name = name.lower()
-        return name in self.names
+        if self.case_sensitive:
+            return entry.name in self.names
+        else:
+            return entry.name.lower() in self.names
 
     def __repr__(self) -> str:
         return "{}({}, case_sensitive={})".format(
@@ -79,6 +105,9 @@ class SelectNames(Selector[AnyStr]):
         else:
             return NotImplemented
 
+    def __hash__(self) -> int:
+        return self._hash
+
 
 @dataclass
 class SelectRegex(Selector[AnyStr]):
@@ -89,10 +118,33 @@ class SelectRegex(Selector[AnyStr]):
     regular expression
     """
 
+    __slots__ = ("pattern", "_literal", "_search")
+
     pattern: AnyStr | re.Pattern[AnyStr]
 
+    def __post_init__(self) -> None:
+        # A pattern without any regex metacharacters is just a substring
+        # test, which the ``in`` operator performs much faster than the regex
+        # engine.  For everything else, re.compile() passes precompiled
+        # patterns through unchanged, and storing the bound search method
+        # skips the module-level re.search()'s cache lookup on every call:
+        self._literal: Optional[AnyStr] = None
+        self._search: Optional[Callable[[AnyStr], Optional[re.Match[AnyStr]]]] = (
+            None
+        )
+        if isinstance(self.pattern, (str, bytes)) and (
+            re.escape(self.pattern) == self.pattern
+        ):
+            self._literal = self.pattern
+        else:
+            self._search = re.compile(self.pattern).search
+
     def __call__(self, entry: os.DirEntry[AnyStr]) -> bool:
-        return bool(re.search(self.pattern, entry.name))
+        literal = self._literal
+        if literal is not None:
+            return literal in entry.name
+        assert self._search is not None
+        return self._search(entry.name) is not None
 
 
 @dataclass
@@ -103,10 +155,96 @@ class SelectGlob(Selector[AnyStr]):
     Selects `~os.DirEntry`'s whose names match the given fileglob pattern
     """
 
+    __slots__ = ("pattern", "_prefix", "_match")
+
     pattern: AnyStr
 
+    def __post_init__(self) -> None:
+        # Compile the pattern once instead of going through fnmatch's
+        # bounded cache on every call.  This mirrors what fnmatch.fnmatch()
+        # does internally, including normcasing the pattern and (for bytes
+        # patterns) the ISO-8859-1 round-trip used to run translate().
+        #
+        # Patterns of the form "prefix*" (like SELECT_DOTS' ".*") don't need
+        # the regex engine at all; they reduce to a startswith() check on the
+        # normcased name.
+        pat = os.path.normcase(self.pattern)
+        self._prefix: Optional[AnyStr] = None
+        self._match: Optional[Callable[[AnyStr], Optional[re.Match[AnyStr]]]] = None
+        if isinstance(pat, bytes):
+            if pat.endswith(b"*") and not re.search(rb"[*?[]", pat[:-1]):
+                self._prefix = pat[:-1]
+                return
+            regex: Any = fnmatch.translate(str(pat, "ISO-8859-1")).encode(
+                "ISO-8859-1"
+            )
+        else:
+            if pat.endswith("*") and not re.search(r"[*?[]", pat[:-1]):
+                self._prefix = pat[:-1]
+                return
+            regex = fnmatch.translate(pat)
+        self._match = re.compile(regex).match
+
     def __call__(self, entry: os.DirEntry[AnyStr]) -> bool:
-        return fnmatch(entry.name, self.pattern)
+        name = os.path.normcase(entry.name)
+        prefix = self._prefix
+        if prefix is not None:
+            return name.startswith(prefix)
+        assert self._match is not None
+        return self._match(name) is not None
+
+
+#: Whether `os.path.normcase()` leaves names unchanged on this platform
+NORMCASE_IS_IDENTITY = os.path.normcase("Aa") == "Aa"
+
+
+def fuse_selectors(
+    selectors: Sequence[Selector[Any]],
+) -> Optional[Callable[[str], Any]]:
+    """
+    If every selector in ``selectors`` is a name-matching `str` selector whose
+    behavior can be expressed as a regular expression, combine them all into a
+    single compiled alternation and return its bound ``search`` method;
+    otherwise, return `None`.
+    """
+    pieces: list[str] = []
+    for s in selectors:
+        if isinstance(s, SelectNames) and s.case_sensitive:
+            if any(not isinstance(n, str) for n in s.names):
+                return None
+            if s.names:
+                names = cast("frozenset[str]", s.names)
+                pieces.append(
+                    r"\A(?:" + "|".join(map(re.escape, sorted(names))) + r")\Z"
+                )
+        elif (
+            isinstance(s, SelectGlob)
+            and isinstance(s.pattern, str)
+            and NORMCASE_IS_IDENTITY
+        ):
+            # translate() output is \Z-anchored already:
+            pieces.append(r"\A" + fnmatch.translate(s.pattern))
+        elif isinstance(s, SelectRegex) and isinstance(s.pattern, str):
+            # Joining patterns with "|" renumbers their capture groups, which
+            # would silently rebind any numbered backreferences, so only
+            # group-free patterns can be fused:
+            if re.compile(s.pattern).groups:
+                return None
+            pieces.append("(?:" + s.pattern + ")")
+        else:
+            return None
+    if not pieces:
+        return None
+    try:
+        with warnings.catch_warnings():
+            # Before Python 3.11, global inline flags in the middle of a
+            # pattern only produced a warning while applying the flag to the
+            # entire alternation; treat that the same as the re.error newer
+            # versions raise:
+            warnings.simplefilter("error")
+            return re.compile("|".join(pieces)).search
+    except (re.error, Warning):
+        return None
 
 
 #: .. versionadded:: 0.3.0
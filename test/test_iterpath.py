@@ -1,13 +1,24 @@
 from __future__ import annotations
 from collections.abc import Callable
+from functools import lru_cache
 import os
 from pathlib import Path
 import platform
-from shutil import copytree, rmtree
+from shutil import copyfile
+from typing import Any
 import pytest
 from iterpath import SELECT_DOTS, iterpath
 
+WINDOWS = platform.system() == "Windows"
 
+WINDOWS_PYPY = WINDOWS and platform.python_implementation() == "PyPy"
+
+
+# The factories are cached so that tests filtering on the same affix share a
+# single predicate object instead of allocating a fresh closure per call:
+
+
+@lru_cache(maxsize=None)
 def name_startswith(prefix: str) -> Callable[[os.DirEntry[str]], bool]:
     def func(e: os.DirEntry[str]) -> bool:
         return e.name.startswith(prefix)
@@ -15,6 +26,7 @@ def name_startswith(prefix: str) -> Callable[[os.DirEntry[str]], bool]:
     return func
 
 
+@lru_cache(maxsize=None)
 def not_name_startswith(prefix: str) -> Callable[[os.DirEntry[str]], bool]:
     def func(e: os.DirEntry[str]) -> bool:
         return not e.name.startswith(prefix)
@@ -22,6 +34,7 @@ def not_name_startswith(prefix: str) -> Callable[[os.DirEntry[str]], bool]:
     return func
 
 
+@lru_cache(maxsize=None)
 def name_endswith(prefix: str) -> Callable[[os.DirEntry[str]], bool]:
     def func(e: os.DirEntry[str]) -> bool:
         return e.name.endswith(prefix)
@@ -29,24 +42,125 @@ def name_endswith(prefix: str) -> Callable[[os.DirEntry[str]], bool]:
     return func
 
 
+@lru_cache(maxsize=None)
+def _reverse(name: str) -> str:
+    return name[::-1]
+
+
 def reverse_name(e: os.DirEntry[str]) -> str:
-    return e.name[::-1]
+    return _reverse(e.name)
+
+
+# The files in the `tree01` fixture; their parent directories are created
+# implicitly:
+TREE01_FILES = (
+    Path(".config", "cfg.ini"),
+    Path(".hidden"),
+    Path("foo.txt"),
+    Path("glarch", "bar.txt"),
+    Path("gnusto", "cleesh.txt"),
+    Path("gnusto", "quux", "quism.txt"),
+    Path("xyzzy.txt"),
+)
+
+# Relative paths of everything in the `tree01` fixture, in sorted order:
+TREE01_CONTENTS = (
+    Path(".config"),
+    Path(".config", "cfg.ini"),
+    Path(".hidden"),
+    Path("foo.txt"),
+    Path("glarch"),
+    Path("glarch", "bar.txt"),
+    Path("gnusto"),
+    Path("gnusto", "cleesh.txt"),
+    Path("gnusto", "quux"),
+    Path("gnusto", "quux", "quism.txt"),
+    Path("xyzzy.txt"),
+)
+
+# Names of the directories in the `tree01` fixture, so that the delete-dirs
+# tests can recognize directories without a stat() call per yielded path:
+TREE01_DIR_NAMES = frozenset(
+    p.name for p in TREE01_CONTENTS if p not in TREE01_FILES
+)
+
+# The files in the `tree03` fixture:
+TREE03_FILES = (
+    Path(".config", "options.txt"),
+    Path(".config", "subdir", "settings.txt"),
+    Path("_cache", "stuff.txt"),
+    Path("_cache", "subcache", "data.txt"),
+    Path("bar.dat"),
+    Path("foo.txt"),
+    Path("glarch", "cleesh.dat"),
+    Path("glarch", "gnusto.txt"),
+    Path("glarch", "xxx.dat"),
+    Path("glarch", "xxx.txt"),
+    Path("xyz.dat"),
+    Path("xyz.txt"),
+)
+
+
+def tree01_paths(root: Path) -> list[Path]:
+    """Sorted contents of the `tree01` fixture, rebased under ``root``"""
+    return [root / p for p in TREE01_CONTENTS]
+
+
+def mktree(dirpath: Path, files: tuple[Path, ...]) -> None:
+    """
+    Create empty ``files`` under ``dirpath``, making parent directories as
+    needed.  Directories are deduplicated up front and the files are created
+    with bare open+close calls, which keeps fixture setup to a couple of
+    syscalls per entry.
+    """
+    base = str(dirpath)
+    filepaths = [os.path.join(base, *p.parts) for p in files]
+    for d in {os.path.dirname(fp) for fp in filepaths}:
+        os.makedirs(d, exist_ok=True)
+    for fp in filepaths:
+        os.close(os.open(fp, os.O_CREAT | os.O_WRONLY, 0o644))
+
+
+def clone_tree(src: Path, dst: Path) -> None:
+    """
+    Copy the tree rooted at ``src`` to ``dst``, hardlinking files instead of
+    copying their contents (falling back to a real copy where links aren't
+    supported)
+    """
+    srcstr = str(src)
+    dststr = str(dst)
+    os.mkdir(dststr)
+    for dirpath, dirnames, filenames in os.walk(srcstr):
+        target = dststr + dirpath[len(srcstr) :]
+        for d in dirnames:
+            os.mkdir(os.path.join(target, d))
+        for f in filenames:
+            sf = os.path.join(dirpath, f)
+            df = os.path.join(target, f)
+            try:
+                os.link(sf, df)
+            except OSError:
+                copyfile(sf, df)
+
+
+def rm_rf(p: str | Path) -> None:
+    """
+    Delete the tree rooted at ``p``, using DirEntry's cached file types
+    instead of the extra stat pass that `shutil.rmtree` performs
+    """
+    with os.scandir(p) as scaniter:
+        for e in scaniter:
+            if e.is_dir(follow_symlinks=False):
+                rm_rf(e.path)
+            else:
+                os.unlink(e.path)
+    os.rmdir(p)
 
 
 @pytest.fixture(scope="session")
 def tree01(tmp_path_factory: pytest.TempPathFactory) -> Path:
     dirpath = tmp_path_factory.mktemp("tree01")
-    for p in [
-        Path(".config", "cfg.ini"),
-        Path(".hidden"),
-        Path("foo.txt"),
-        Path("glarch", "bar.txt"),
-        Path("gnusto", "cleesh.txt"),
-        Path("gnusto", "quux", "quism.txt"),
-        Path("xyzzy.txt"),
-    ]:
-        (dirpath / p).parent.mkdir(parents=True, exist_ok=True)
-        (dirpath / p).touch()
+    mktree(dirpath, TREE01_FILES)
     return dirpath
 
 
@@ -63,57 +177,18 @@ def link_dir(tmp_path_factory: pytest.TempPathFactory, tree01: Path) -> Path:
 @pytest.fixture(scope="session")
 def tree03(tmp_path_factory: pytest.TempPathFactory) -> Path:
     dirpath = tmp_path_factory.mktemp("tree03")
-    for p in [
-        Path(".config", "options.txt"),
-        Path(".config", "subdir", "settings.txt"),
-        Path("_cache", "stuff.txt"),
-        Path("_cache", "subcache", "data.txt"),
-        Path("bar.dat"),
-        Path("foo.txt"),
-        Path("glarch", "cleesh.dat"),
-        Path("glarch", "gnusto.txt"),
-        Path("glarch", "xxx.dat"),
-        Path("glarch", "xxx.txt"),
-        Path("xyz.dat"),
-        Path("xyz.txt"),
-    ]:
-        (dirpath / p).parent.mkdir(parents=True, exist_ok=True)
-        (dirpath / p).touch()
+    mktree(dirpath, TREE03_FILES)
     return dirpath
 
 
 def test_iterpath(tree01: Path) -> None:
     with iterpath(tree01) as ip:
-        assert sorted(ip) == [
-            tree01 / ".config",
-            tree01 / ".config" / "cfg.ini",
-            tree01 / ".hidden",
-            tree01 / "foo.txt",
-            tree01 / "glarch",
-            tree01 / "glarch" / "bar.txt",
-            tree01 / "gnusto",
-            tree01 / "gnusto" / "cleesh.txt",
-            tree01 / "gnusto" / "quux",
-            tree01 / "gnusto" / "quux" / "quism.txt",
-            tree01 / "xyzzy.txt",
-        ]
+        assert sorted(ip) == tree01_paths(tree01)
 
 
 def test_iterpath_sort(tree01: Path) -> None:
     with iterpath(tree01, sort=True) as ip:
-        assert list(ip) == [
-            tree01 / ".config",
-            tree01 / ".config" / "cfg.ini",
-            tree01 / ".hidden",
-            tree01 / "foo.txt",
-            tree01 / "glarch",
-            tree01 / "glarch" / "bar.txt",
-            tree01 / "gnusto",
-            tree01 / "gnusto" / "cleesh.txt",
-            tree01 / "gnusto" / "quux",
-            tree01 / "gnusto" / "quux" / "quism.txt",
-            tree01 / "xyzzy.txt",
-        ]
+        assert list(ip) == tree01_paths(tree01)
 
 
 def test_iterpath_sort_relpath_curdir(
@@ -121,19 +196,7 @@ def test_iterpath_sort_relpath_curdir(
 ) -> None:
     monkeypatch.chdir(tree01)
     with iterpath(os.curdir, sort=True) as ip:
-        assert list(ip) == [
-            Path(".config"),
-            Path(".config", "cfg.ini"),
-            Path(".hidden"),
-            Path("foo.txt"),
-            Path("glarch"),
-            Path("glarch", "bar.txt"),
-            Path("gnusto"),
-            Path("gnusto", "cleesh.txt"),
-            Path("gnusto", "quux"),
-            Path("gnusto", "quux", "quism.txt"),
-            Path("xyzzy.txt"),
-        ]
+        assert list(ip) == list(TREE01_CONTENTS)
 
 
 def test_iterpath_sort_relpath_prefix(
@@ -141,19 +204,7 @@ def test_iterpath_sort_relpath_prefix(
 ) -> None:
     monkeypatch.chdir(tree01.parent)
     with iterpath(tree01.name, sort=True) as ip:
-        assert list(ip) == [
-            Path(tree01.name, ".config"),
-            Path(tree01.name, ".config", "cfg.ini"),
-            Path(tree01.name, ".hidden"),
-            Path(tree01.name, "foo.txt"),
-            Path(tree01.name, "glarch"),
-            Path(tree01.name, "glarch", "bar.txt"),
-            Path(tree01.name, "gnusto"),
-            Path(tree01.name, "gnusto", "cleesh.txt"),
-            Path(tree01.name, "gnusto", "quux"),
-            Path(tree01.name, "gnusto", "quux", "quism.txt"),
-            Path(tree01.name, "xyzzy.txt"),
-        ]
+        assert list(ip) == tree01_paths(Path(tree01.name))
 
 
 def test_iterpath_sort_no_dirs(tree01: Path) -> None:
@@ -188,20 +239,7 @@ def test_iterpath_sort_no_topdown(tree01: Path) -> None:
 
 def test_iterpath_sort_include_root(tree01: Path) -> None:
     with iterpath(tree01, sort=True, include_root=True) as ip:
-        assert list(ip) == [
-            tree01,
-            tree01 / ".config",
-            tree01 / ".config" / "cfg.ini",
-            tree01 / ".hidden",
-            tree01 / "foo.txt",
-            tree01 / "glarch",
-            tree01 / "glarch" / "bar.txt",
-            tree01 / "gnusto",
-            tree01 / "gnusto" / "cleesh.txt",
-            tree01 / "gnusto" / "quux",
-            tree01 / "gnusto" / "quux" / "quism.txt",
-            tree01 / "xyzzy.txt",
-        ]
+        assert list(ip) == [tree01] + tree01_paths(tree01)
 
 
 def test_iterpath_sort_include_root_no_topdown(tree01: Path) -> None:
@@ -337,24 +375,32 @@ def test_iterpath_sort_filter(tree01: Path) -> None:
         ]
 
 
-def test_iterpath_filter_filter_dirs(tree01: Path) -> None:
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {
+            "filter": not_name_startswith("."),
+            "filter_dirs": not_name_startswith("f"),
+        },
+        {
+            "filter": not_name_startswith("."),
+            "filter_files": not_name_startswith("f"),
+        },
+        {
+            "exclude": name_startswith("."),
+            "exclude_dirs": name_startswith("f"),
+        },
+        {
+            "exclude": name_startswith("."),
+            "exclude_files": name_startswith("f"),
+        },
+    ],
+)
+def test_iterpath_mutually_exclusive(tree01: Path, kwargs: dict[str, Any]) -> None:
+    arg1, arg2 = kwargs
     with pytest.raises(TypeError) as excinfo:
-        iterpath(
-            tree01,
-            filter=not_name_startswith("."),
-            filter_dirs=not_name_startswith("f"),
-        )
-    assert str(excinfo.value) == "filter and filter_dirs are mutually exclusive"
-
-
-def test_iterpath_filter_filter_files(tree01: Path) -> None:
-    with pytest.raises(TypeError) as excinfo:
-        iterpath(
-            tree01,
-            filter=not_name_startswith("."),
-            filter_files=not_name_startswith("f"),
-        )
-    assert str(excinfo.value) == "filter and filter_files are mutually exclusive"
+        iterpath(tree01, **kwargs)
+    assert str(excinfo.value) == f"{arg1} and {arg2} are mutually exclusive"
 
 
 def test_iterpath_sort_exclude_dirs(tree01: Path) -> None:
@@ -435,22 +481,6 @@ def test_iterpath_sort_exclude_selector(tree01: Path) -> None:
         ]
 
 
-def test_iterpath_exclude_exclude_dirs(tree01: Path) -> None:
-    with pytest.raises(TypeError) as excinfo:
-        iterpath(
-            tree01, exclude=name_startswith("."), exclude_dirs=name_startswith("f")
-        )
-    assert str(excinfo.value) == "exclude and exclude_dirs are mutually exclusive"
-
-
-def test_iterpath_exclude_exclude_files(tree01: Path) -> None:
-    with pytest.raises(TypeError) as excinfo:
-        iterpath(
-            tree01, exclude=name_startswith("."), exclude_files=name_startswith("f")
-        )
-    assert str(excinfo.value) == "exclude and exclude_files are mutually exclusive"
-
-
 def test_iterpath_sort_filter_and_exclude_dirs_and_files(tree03: Path) -> None:
     with iterpath(
         tree03,
@@ -469,13 +499,13 @@ def test_iterpath_sort_filter_and_exclude_dirs_and_files(tree03: Path) -> None:
 
 def test_iterpath_sort_delete_dirs(tree01: Path, tmp_path: Path) -> None:
     dirpath = tmp_path / "dir"
-    copytree(tree01, dirpath)
+    clone_tree(tree01, dirpath)
     paths = []
     with iterpath(dirpath, sort=True) as ip:
         for p in ip:
             paths.append(p)
-            if p.is_dir():
-                rmtree(p)
+            if p.name in TREE01_DIR_NAMES:
+                rm_rf(p)
     assert paths == [
         dirpath / ".config",
         dirpath / ".hidden",
@@ -491,14 +521,14 @@ def test_iterpath_sort_delete_dirs_onerror_raise(tmp_path: Path, tree01: Path) -
         raise e
 
     dirpath = tmp_path / "dir"
-    copytree(tree01, dirpath)
+    clone_tree(tree01, dirpath)
     paths = []
     with pytest.raises(OSError) as excinfo:
         with iterpath(dirpath, sort=True, onerror=raise_) as ip:
             for p in ip:
                 paths.append(p)
-                if p.is_dir():
-                    rmtree(p)
+                if p.name in TREE01_DIR_NAMES:
+                    rm_rf(p)
     # Apply `Path` to `.filename` to get something predictable, as it's a str
     # on CPython, an os.DirEntry on PyPy-3.6, and a bytes on PyPy-3.7:
     assert Path(os.fsdecode(excinfo.value.filename)) == dirpath / ".config"
@@ -512,13 +542,13 @@ def test_iterpath_sort_delete_dirs_onerror_record(tmp_path: Path, tree01: Path)
         error_files.append(Path(os.fsdecode(e.filename)))
 
     dirpath = tmp_path / "dir"
-    copytree(tree01, dirpath)
+    clone_tree(tree01, dirpath)
     paths = []
     with iterpath(dirpath, sort=True, onerror=record) as ip:
         for p in ip:
             paths.append(p)
-            if p.is_dir():
-                rmtree(p)
+            if p.name in TREE01_DIR_NAMES:
+                rm_rf(p)
     assert paths == [
         dirpath / ".config",
         dirpath / ".hidden",
@@ -535,7 +565,7 @@ def test_iterpath_sort_delete_dirs_onerror_record(tmp_path: Path, tree01: Path)
 
 
 @pytest.mark.xfail(
-    platform.system() == "Windows" and platform.python_implementation() == "PyPy",
+    WINDOWS_PYPY,
     reason="Symlinks are not implemented on PyPy on Windows as of v7.3.3",
 )
 @pytest.mark.parametrize("dirs", [True, False])
@@ -550,32 +580,25 @@ def test_linked_iterpath_sort(dirs: bool, link_dir: Path) -> None:
 
 
 @pytest.mark.xfail(
-    platform.system() == "Windows" and platform.python_implementation() == "PyPy",
+    WINDOWS_PYPY,
     reason="Symlinks are not implemented on PyPy on Windows as of v7.3.3",
 )
 def test_linked_iterpath_sort_followlinks(link_dir: Path) -> None:
     with iterpath(link_dir, sort=True, followlinks=True) as ip:
-        assert list(ip) == [
-            link_dir / "apple.txt",
-            link_dir / "banana.txt",
-            link_dir / "link",
-            link_dir / "link" / ".config",
-            link_dir / "link" / ".config" / "cfg.ini",
-            link_dir / "link" / ".hidden",
-            link_dir / "link" / "foo.txt",
-            link_dir / "link" / "glarch",
-            link_dir / "link" / "glarch" / "bar.txt",
-            link_dir / "link" / "gnusto",
-            link_dir / "link" / "gnusto" / "cleesh.txt",
-            link_dir / "link" / "gnusto" / "quux",
-            link_dir / "link" / "gnusto" / "quux" / "quism.txt",
-            link_dir / "link" / "xyzzy.txt",
-            link_dir / "mango.txt",
-        ]
+        assert (
+            list(ip)
+            == [
+                link_dir / "apple.txt",
+                link_dir / "banana.txt",
+                link_dir / "link",
+            ]
+            + tree01_paths(link_dir / "link")
+            + [link_dir / "mango.txt"]
+        )
 
 
 @pytest.mark.xfail(
-    platform.system() == "Windows" and platform.python_implementation() == "PyPy",
+    WINDOWS_PYPY,
     reason="Symlinks are not implemented on PyPy on Windows as of v7.3.3",
 )
 def test_linked_iterpath_sort_followlinks_no_dirs(link_dir: Path) -> None:
@@ -595,24 +618,12 @@ def test_linked_iterpath_sort_followlinks_no_dirs(link_dir: Path) -> None:
 
 
 @pytest.mark.skipif(
-    platform.system() == "Windows",
-    reason="bytes(Path) should only be used on POSIX",
+    WINDOWS,
+    reason="bytes paths should only be used on POSIX",
 )
 def test_iterpath_sort_bytes(tree01: Path) -> None:
-    with iterpath(bytes(tree01), sort=True) as ip:
-        assert list(ip) == [
-            tree01 / ".config",
-            tree01 / ".config" / "cfg.ini",
-            tree01 / ".hidden",
-            tree01 / "foo.txt",
-            tree01 / "glarch",
-            tree01 / "glarch" / "bar.txt",
-            tree01 / "gnusto",
-            tree01 / "gnusto" / "cleesh.txt",
-            tree01 / "gnusto" / "quux",
-            tree01 / "gnusto" / "quux" / "quism.txt",
-            tree01 / "xyzzy.txt",
-        ]
+    with iterpath(os.fsencode(tree01), sort=True) as ip:
+        assert list(ip) == tree01_paths(tree01)
 
 
 @pytest.mark.parametrize("return_relative", [False, True])
@@ -621,54 +632,17 @@ def test_iterpath_sort_default_curdir(
 ) -> None:
     monkeypatch.chdir(tree01)
     with iterpath(sort=True, return_relative=return_relative) as ip:
-        assert list(ip) == [
-            Path(".config"),
-            Path(".config", "cfg.ini"),
-            Path(".hidden"),
-            Path("foo.txt"),
-            Path("glarch"),
-            Path("glarch", "bar.txt"),
-            Path("gnusto"),
-            Path("gnusto", "cleesh.txt"),
-            Path("gnusto", "quux"),
-            Path("gnusto", "quux", "quism.txt"),
-            Path("xyzzy.txt"),
-        ]
+        assert list(ip) == list(TREE01_CONTENTS)
 
 
 def test_iterpath_sort_return_relative(tree01: Path) -> None:
     with iterpath(tree01, sort=True, return_relative=True) as ip:
-        assert list(ip) == [
-            Path(".config"),
-            Path(".config", "cfg.ini"),
-            Path(".hidden"),
-            Path("foo.txt"),
-            Path("glarch"),
-            Path("glarch", "bar.txt"),
-            Path("gnusto"),
-            Path("gnusto", "cleesh.txt"),
-            Path("gnusto", "quux"),
-            Path("gnusto", "quux", "quism.txt"),
-            Path("xyzzy.txt"),
-        ]
+        assert list(ip) == list(TREE01_CONTENTS)
 
 
 def test_iterpath_sort_return_relative_include_root(tree01: Path) -> None:
     with iterpath(tree01, sort=True, return_relative=True, include_root=True) as ip:
-        assert list(ip) == [
-            Path(),
-            Path(".config"),
-            Path(".config", "cfg.ini"),
-            Path(".hidden"),
-            Path("foo.txt"),
-            Path("glarch"),
-            Path("glarch", "bar.txt"),
-            Path("gnusto"),
-            Path("gnusto", "cleesh.txt"),
-            Path("gnusto", "quux"),
-            Path("gnusto", "quux", "quism.txt"),
-            Path("xyzzy.txt"),
-        ]
+        assert list(ip) == [Path()] + list(TREE01_CONTENTS)
 
 
 def test_iterpath_sort_return_relative_no_topdown(tree01: Path) -> None:
@@ -1,5 +1,6 @@
-from typing import Any
-from unittest.mock import Mock
+from __future__ import annotations
+import os
+from typing import Any, NamedTuple
 import pytest
 from iterpath import (
     SELECT_DOTS,
@@ -10,13 +11,71 @@ from iterpath import (
     SelectGlob,
     SelectNames,
     SelectRegex,
+    Selector,
 )
 
 
-def namedobj(name: str) -> Any:
-    entry = Mock()
-    entry.configure_mock(name=name)
-    return entry
+class NamedObj(NamedTuple):
+    name: Any
+
+
+def namedobj(name: Any) -> Any:
+    return NamedObj(name)
+
+
+VCS_DIR_CASES = [
+    (".git", True),
+    ("git", False),
+    ("_git", False),
+    (".gitignore", False),
+    ("foo.git", False),
+    (".hg", True),
+    ("_darcs", True),
+    (".darcs", False),
+    (".bzr", True),
+    (".svn", True),
+    ("_svn", True),
+    ("CVS", True),
+    ("cvs", False),
+    (".cvs", False),
+    ("RCS", True),
+    ("rcs", False),
+    (".rcs", False),
+    ("foo.txt", False),
+]
+
+VCS_FILE_CASES = [
+    (".git", False),
+    (".gitattributes", True),
+    (".gitignore", True),
+    ("_gitignore", False),
+    (".gitmodules", True),
+    (".gitfoo", False),
+    (".mailmap", True),
+    (".gitmailmap", False),
+    (".hgignore", True),
+    (".hgsigs", True),
+    (".hgtags", True),
+    (".binaries", True),
+    (".boring", True),
+    (".bzrignore", True),
+    ("foo.txt,v", True),
+    (",v", False),
+    (".gitignore,v", True),
+    ("foo.txt", False),
+]
+
+
+def union_cases(*tables: list[tuple[str, bool]]) -> list[tuple[str, bool]]:
+    """
+    Combine expected-result tables for selectors joined with ``|``: a name is
+    selected by the union iff any table selects it
+    """
+    cases: dict[str, bool] = {}
+    for table in tables:
+        for name, r in table:
+            cases[name] = cases.get(name, False) or r
+    return list(cases.items())
 
 
 @pytest.mark.parametrize(
@@ -71,6 +130,12 @@ def test_select_names_repr_insensitive() -> None:
     assert repr(s) == "SelectNames('.gh', 'bar.png', 'foo.txt', case_sensitive=False)"
 
 
+def test_select_names_hash() -> None:
+    s = SelectNames("foo.txt", "bar.png", ".gh")
+    assert hash(s) == hash(SelectNames(".gh", "foo.txt", "bar.png"))
+    assert {s, SelectNames("bar.png", ".gh", "foo.txt")} == {s}
+
+
 def test_select_names_eq() -> None:
     s = SelectNames("foo.txt", "bar.png", ".gh")
     assert s == SelectNames(".gh", "foo.txt", "bar.png")
@@ -120,6 +185,21 @@ def test_select_regex(name: str, r: bool) -> None:
     assert s(namedobj(name)) is r
 
 
+@pytest.mark.parametrize(
+    "name,r",
+    [
+        ("abab", True),
+        ("xababy", True),
+        ("ab", False),
+        ("baba.txt", False),
+        ("", False),
+    ],
+)
+def test_select_regex_literal(name: str, r: bool) -> None:
+    s = SelectRegex("abab")
+    assert s(namedobj(name)) is r
+
+
 @pytest.mark.parametrize(
     "name,r",
     [
@@ -133,6 +213,20 @@ def test_select_dots(name: str, r: bool) -> None:
     assert SELECT_DOTS(namedobj(name)) is r
 
 
+@pytest.mark.parametrize(
+    "name,r",
+    [
+        (b"foo.txt", True),
+        (b"foo", True),
+        (b"barfoo", False),
+        (b"", False),
+    ],
+)
+def test_select_glob_bytes_prefix(name: bytes, r: bool) -> None:
+    s = SelectGlob(b"foo*")
+    assert s(namedobj(name)) is r
+
+
 @pytest.mark.parametrize(
     "name,r",
     [
@@ -184,97 +278,73 @@ def test_or_or() -> None:
     assert sor == SelectAny([s1, s2, s3, s4])
 
 
+def test_select_any_custom_selector() -> None:
+    class SelectShouty(Selector[str]):
+        def __call__(self, entry: os.DirEntry[str]) -> bool:
+            return entry.name.isupper()
+
+    s = SelectShouty() | SelectGlob("*.txt")
+    assert s(namedobj("FOO")) is True
+    assert s(namedobj("foo.txt")) is True
+    assert s(namedobj("foo")) is False
+
+
 @pytest.mark.parametrize(
     "name,r",
     [
-        (".git", True),
-        ("git", False),
-        ("_git", False),
-        (".gitignore", False),
-        ("foo.git", False),
-        (".hg", True),
-        ("_darcs", True),
-        (".darcs", False),
-        (".bzr", True),
-        (".svn", True),
-        ("_svn", True),
-        ("CVS", True),
-        ("cvs", False),
-        (".cvs", False),
-        ("RCS", True),
-        ("rcs", False),
-        (".rcs", False),
-        ("foo.txt", False),
+        ("foo.txt", True),
+        ("FOO.TXT", True),
+        ("bar.png", True),
+        ("quux.pdf", False),
+        ("foo", False),
     ],
 )
+def test_select_any_insensitive_names(name: str, r: bool) -> None:
+    s = SelectNames("foo.txt", case_sensitive=False) | SelectNames("bar.png")
+    assert s(namedobj(name)) is r
+
+
+def test_select_any_backreference_regex() -> None:
+    # Fusing these patterns into a single alternation would renumber their
+    # capture groups and silently rebind the backreferences:
+    s = SelectRegex(r"(a)\1") | SelectRegex(r"(b)\1")
+    assert s(namedobj("aa")) is True
+    assert s(namedobj("bb")) is True
+    assert s(namedobj("ab")) is False
+
+
+def test_select_any_global_flags_regex() -> None:
+    # A global inline flag cannot appear mid-alternation, so this union
+    # cannot be fused:
+    s = SelectRegex("(?i)foo") | SelectNames("bar")
+    assert s(namedobj("FOO.txt")) is True
+    assert s(namedobj("bar")) is True
+    assert s(namedobj("quux")) is False
+
+
+def test_select_any_bytes() -> None:
+    s = SelectNames(b"foo.txt") | SelectGlob(b"*.png")
+    assert s(namedobj(b"foo.txt")) is True
+    assert s(namedobj(b"bar.png")) is True
+    assert s(namedobj(b"bar.txt")) is False
+
+
+def test_select_any_no_names() -> None:
+    s = SelectAny([SelectNames()])
+    assert s(namedobj("foo")) is False
+    assert s(namedobj("")) is False
+
+
+@pytest.mark.parametrize("name,r", VCS_DIR_CASES)
 def test_select_vcs_dirs(name: str, r: bool) -> None:
     assert SELECT_VCS_DIRS(namedobj(name)) is r
 
 
-@pytest.mark.parametrize(
-    "name,r",
-    [
-        (".git", False),
-        (".gitattributes", True),
-        (".gitignore", True),
-        ("_gitignore", False),
-        (".gitmodules", True),
-        (".gitfoo", False),
-        (".mailmap", True),
-        (".gitmailmap", False),
-        (".hgignore", True),
-        (".hgsigs", True),
-        (".hgtags", True),
-        (".binaries", True),
-        (".boring", True),
-        (".bzrignore", True),
-        ("foo.txt,v", True),
-        (",v", False),
-        (".gitignore,v", True),
-        ("foo.txt", False),
-    ],
-)
+@pytest.mark.parametrize("name,r", VCS_FILE_CASES)
 def test_select_vcs_files(name: str, r: bool) -> None:
     assert SELECT_VCS_FILES(namedobj(name)) is r
 
 
-@pytest.mark.parametrize(
-    "name,r",
-    [
-        (".git", True),
-        ("git", False),
-        ("_git", False),
-        ("foo.git", False),
-        (".hg", True),
-        ("_darcs", True),
-        (".darcs", False),
-        (".bzr", True),
-        (".svn", True),
-        ("_svn", True),
-        ("CVS", True),
-        ("cvs", False),
-        (".cvs", False),
-        ("RCS", True),
-        ("rcs", False),
-        (".rcs", False),
-        (".gitattributes", True),
-        (".gitignore", True),
-        ("_gitignore", False),
-        (".gitmodules", True),
-        (".gitfoo", False),
-        (".mailmap", True),
-        (".gitmailmap", False),
-        (".hgignore", True),
-        (".hgsigs", True),
-        (".hgtags", True),
-        (".binaries", True),
-        (".boring", True),
-        (".bzrignore", True),
-        ("foo.txt,v", True),
-        (",v", False),
-        (".gitignore,v", True),
-        ("foo.txt", False),
-    ],
-)
+@pytest.mark.parametrize("name,r", union_cases(VCS_DIR_CASES, VCS_FILE_CASES))
 def test_select_vcs(name: str, r: bool) -> None:
     assert SELECT_VCS(namedobj(name)) is r